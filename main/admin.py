@@ -1,18 +1,65 @@
 from __future__ import annotations
 
 from django.contrib import admin
-from django.utils.html import format_html
+from django.db.models import Case, CharField, F, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import GreaterThan
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 
 from .models import ContactMessage, Education, Experience, Profile, Project
 
+# Preview markup, defined once. The URL is escaped and spliced in with str.format,
+# skipping format_html's argument handling on every preview render.
+_PROFILE_IMG_TMPL = '<img src="{}" loading="lazy" decoding="async" style="width:100px;height:100px;object-fit:cover;border-radius:50%;border:1px solid #ddd;" />'
+_PROJECT_IMG_TMPL = '<img src="{}" loading="lazy" decoding="async" style="width:160px;height:105px;object-fit:cover;border:1px solid #ddd;border-radius:6px;" />'
+
+
+class ChangelistOnlyMixin:
+    """
+    Restrict changelist queries to the columns the list actually renders.
+    `list_only` is passed to .only() on the changelist page; the change form
+    still loads the full row.
+    When a model gains an FK shown in list_display, add it to
+    `list_select_related` (and its `<fk>_id` to `list_only`) so rows don't N+1.
+    """
+
+    list_only: tuple[str, ...] = ()
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if self.list_only and match and match.url_name.endswith("_changelist"):
+            qs = qs.only(*self.list_only)
+        return qs
+
+
+class ListEditableSaveMixin:
+    """
+    When an edit only touches list_editable columns (the usual changelist
+    toggle), UPDATE just those plus `list_editable_also_update` instead of
+    writing every column back.
+    """
+
+    list_editable_also_update: tuple[str, ...] = ()
+
+    def save_model(self, request, obj, form, change):
+        changed = set(form.changed_data)
+        if change and changed and changed <= set(self.list_editable):
+            obj.save(update_fields=[*changed, *self.list_editable_also_update])
+        else:
+            super().save_model(request, obj, form, change)
+
 
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(ListEditableSaveMixin, ChangelistOnlyMixin, admin.ModelAdmin):
     """
     Keep ONE Profile row in DB (your personal portfolio owner profile).
     """
 
     list_display = ("full_name", "headline", "email", "updated_at")
+    list_only = ("full_name", "headline", "email", "updated_at")
+    list_editable_also_update = ("updated_at",)  # auto_now only persists if listed
     list_editable = ("headline",)
     search_fields = ("full_name", "email", "headline")
     readonly_fields = ("updated_at", "profile_image_preview")
@@ -55,16 +102,15 @@ class ProfileAdmin(admin.ModelAdmin):
     @admin.display(description="Profile Image")
     def profile_image_preview(self, obj: Profile):
         if obj.profile_image:
-            return format_html(
-                '<img src="{}" style="width:100px;height:100px;object-fit:cover;border-radius:50%;border:1px solid #ddd;" />',
-                obj.profile_image.url,
-            )
+            return mark_safe(_PROFILE_IMG_TMPL.format(escape(obj.profile_image.url)))
         return "No image"
 
 
 @admin.register(Experience)
-class ExperienceAdmin(admin.ModelAdmin):
-    list_display = ("role", "organization", "start_date_display", "end_date_display", "is_current")
+class ExperienceAdmin(ListEditableSaveMixin, ChangelistOnlyMixin, admin.ModelAdmin):
+    list_display = ("role", "organization", "period_display", "end_date_display", "is_current")
+    # Dates stay loaded: a list_editable toggle re-derives display_period on save.
+    list_only = ("role", "organization", "display_period", "start_date", "end_date", "is_current")
     list_filter = ("organization", "is_current", "start_date")
     search_fields = ("role", "organization", "location", "description")
     list_editable = ("is_current",)
@@ -76,12 +122,15 @@ class ExperienceAdmin(admin.ModelAdmin):
         ("Description", {"fields": ("description",)}),
     )
 
-    @admin.display(description="Start", ordering="start_date")
-    def start_date_display(self, obj: Experience):
-        return obj.start_date.strftime("%b %Y")
+    @admin.display(description="Period", ordering="start_date")
+    def period_display(self, obj: Experience):
+        # Precomputed on save; sorted by the real date, not the label.
+        return obj.display_period
 
     @admin.display(description="End", ordering="end_date")
     def end_date_display(self, obj: Experience):
+        # Keeps end-date sorting, and tells "no end date" apart from a label
+        # that only shows the start month.
         if obj.is_current:
             return "Present"
         if obj.end_date:
@@ -90,8 +139,9 @@ class ExperienceAdmin(admin.ModelAdmin):
 
 
 @admin.register(Education)
-class EducationAdmin(admin.ModelAdmin):
+class EducationAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ("degree", "institution", "years_display", "result_or_cgpa")
+    list_only = ("degree", "institution", "start_year", "end_year", "result_or_cgpa")
     list_filter = ("institution", "start_year")
     search_fields = ("degree", "institution", "field_of_study", "description")
     ordering = ("-end_year", "-start_year")
@@ -109,8 +159,10 @@ class EducationAdmin(admin.ModelAdmin):
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(ListEditableSaveMixin, ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ("title", "is_featured", "tech_stack_short", "created_at")
+    # tech_stack itself isn't loaded; the list reads the truncated annotation.
+    list_only = ("title", "slug", "is_featured", "created_at")
     list_filter = ("is_featured", "created_at")
     list_editable = ("is_featured",)
     search_fields = ("title", "short_description", "tech_stack")
@@ -132,22 +184,38 @@ class ProjectAdmin(admin.ModelAdmin):
         ("Timestamps", {"fields": ("created_at",), "classes": ("collapse",)}),
     )
 
+    def get_queryset(self, request):
+        # Truncate tech_stack in SQL so rows carry only the short form.
+        return super().get_queryset(request).annotate(
+            tech_stack_short_db=Case(
+                When(
+                    GreaterThan(Length("tech_stack"), 60),
+                    then=Concat(Substr("tech_stack", 1, 60), Value("...")),
+                ),
+                default=F("tech_stack"),
+                output_field=CharField(),
+            )
+        )
+
     @admin.display(description="Tech Stack")
     def tech_stack_short(self, obj: Project):
-        return (obj.tech_stack[:60] + "...") if len(obj.tech_stack) > 60 else obj.tech_stack
+        return obj.tech_stack_short_db
 
     @admin.display(description="Project Image")
     def image_preview(self, obj: Project):
         if obj.image:
-            return format_html(
-                '<img src="{}" style="width:160px;height:105px;object-fit:cover;border:1px solid #ddd;border-radius:6px;" />',
-                obj.image.url,
-            )
+            return mark_safe(_PROJECT_IMG_TMPL.format(escape(obj.image.url)))
         return "No image"
 
 
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
+    """
+    Bulk actions stay as a single queryset.update() — never loop over rows.
+    Any future export action should stream with
+    queryset.iterator(chunk_size=2000) instead of materializing the inbox.
+    """
+
     list_display = ("name", "email", "subject", "created_at", "is_read")
     list_filter = ("is_read", "created_at")
     search_fields = ("name", "email", "subject", "message")
@@ -1,11 +1,21 @@
-from .models import Profile, SiteSettings
+from django.utils.functional import SimpleLazyObject
+
+from .models import Profile, SiteSettings, content_version
 
 
 def site_settings(request):
     """
     Context processor to make site settings and profile available globally.
+    Uses the lazy objects set by SiteContextMiddleware; requests that bypassed
+    the middleware (e.g. RequestFactory in tests) get equivalent lazy lookups.
     """
+    if not hasattr(request, 'site_settings'):
+        request.site_settings = SimpleLazyObject(SiteSettings.cache.get_solo)
+    if not hasattr(request, 'profile'):
+        request.profile = SimpleLazyObject(Profile.cache.get_singleton)
     return {
-        'site_settings': SiteSettings.objects.first(),
-        'profile': Profile.objects.first(),
+        'site_settings': request.site_settings,
+        'profile': request.profile,
+        # Key for {% cache %} fragments; only read when a template uses it.
+        'content_version': SimpleLazyObject(content_version),
     }
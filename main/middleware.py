@@ -0,0 +1,20 @@
+from django.utils.functional import SimpleLazyObject
+
+from .models import Profile, SiteSettings
+
+
+class SiteContextMiddleware:
+    """
+    Attach the cached Profile / SiteSettings singletons to the request
+    (SiteSettings falls back to unsaved defaults until a row is saved).
+    Both are lazy, so responses that never read them (redirects, admin, JSON)
+    skip the cache/DB lookup entirely.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.profile = SimpleLazyObject(Profile.cache.get_singleton)
+        request.site_settings = SimpleLazyObject(SiteSettings.cache.get_solo)
+        return self.get_response(request)
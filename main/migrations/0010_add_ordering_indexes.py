@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_alter_sitesettings_theme'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='theme',
+            field=models.CharField(choices=[('dark_red', 'Dark Red (Professional)'), ('dark_blue', 'Dark Blue (Corporate)'), ('dark_green', 'Dark Green (Nature)'), ('dark_purple', 'Dark Purple (Creative)'), ('ocean_deep', 'Ocean Deep (Calm)'), ('sunset_orange', 'Sunset Orange (Warm)'), ('forest_dark', 'Forest Dark (Organic)'), ('royal_purple', 'Royal Purple (Elegant)'), ('cyberpunk', 'Cyberpunk (Futuristic)'), ('midnight_blue', 'Midnight Blue (Deep)'), ('default', 'Default (Reset to Original)')], default='dark_red', help_text='Choose a color theme for the entire site', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_read', '-created_at'], name='main_contac_is_read_d0daa0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-start_date'], name='main_experi_start_d_80657c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at'], name='main_projec_created_1bf4c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_featured', '-created_at'], name='main_projec_is_feat_83a36d_idx'),
+        ),
+    ]
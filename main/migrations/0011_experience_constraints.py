@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:55
+
+from django.db import migrations, models
+
+
+def fix_experience_dates(apps, schema_editor):
+    # Make existing rows satisfy the CHECKs below. Current roles drop their
+    # end_date (as Experience.save() does); an end before the start is taken
+    # as the two dates entered the wrong way round and swapped.
+    Experience = apps.get_model('main', 'Experience')
+    Experience.objects.filter(is_current=True, end_date__isnull=False).update(end_date=None)
+    for exp in Experience.objects.filter(end_date__lt=models.F('start_date')):
+        exp.start_date, exp.end_date = exp.end_date, exp.start_date
+        exp.save(update_fields=['start_date', 'end_date'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_add_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(fix_experience_dates, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('is_current', True)), fields=['-start_date'], name='idx_exp_current'),
+        ),
+        migrations.AddConstraint(
+            model_name='experience',
+            constraint=models.CheckConstraint(condition=models.Q(('is_current', False), ('end_date__isnull', True), _connector='OR'), name='exp_current_no_end', violation_error_message="If 'is_current' is True, 'end_date' should be empty."),
+        ),
+        migrations.AddConstraint(
+            model_name='experience',
+            constraint=models.CheckConstraint(condition=models.Q(('end_date__isnull', True), ('end_date__gte', models.F('start_date')), _connector='OR'), name='exp_end_after_start', violation_error_message="'end_date' cannot be earlier than 'start_date'."),
+        ),
+    ]
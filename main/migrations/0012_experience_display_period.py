@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-15 10:57
+
+from django.db import migrations, models
+
+
+def fill_display_period(apps, schema_editor):
+    # Historical models don't carry Experience.build_display_period(); mirror it here.
+    Experience = apps.get_model('main', 'Experience')
+    for exp in Experience.objects.all():
+        start = exp.start_date.strftime('%b %Y')
+        if exp.is_current:
+            exp.display_period = f'{start} – Present'
+        elif exp.end_date:
+            exp.display_period = f"{start} – {exp.end_date.strftime('%b %Y')}"
+        else:
+            exp.display_period = start
+        exp.save(update_fields=['display_period'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_experience_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='experience',
+            name='display_period',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.RunPython(fill_display_period, migrations.RunPython.noop),
+    ]
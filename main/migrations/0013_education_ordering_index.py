@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_experience_display_period'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['-end_year', '-start_year'], name='main_educat_end_yea_c23764_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_education_ordering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at'], name='main_contac_created_f03f63_idx'),
+        ),
+    ]
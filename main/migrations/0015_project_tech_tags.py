@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:02
+
+from django.db import migrations, models
+
+
+def fill_tech_tags(apps, schema_editor):
+    # Historical models don't carry Project.save(); mirror split_csv() here.
+    Project = apps.get_model('main', 'Project')
+    for project in Project.objects.all():
+        project.tech_tags = [t.strip() for t in project.tech_stack.split(',') if t.strip()]
+        project.save(update_fields=['tech_tags'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_contactmessage_ordering_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='tech_tags',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(fill_tech_tags, migrations.RunPython.noop),
+    ]
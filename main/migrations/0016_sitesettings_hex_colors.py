@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:03
+
+import re
+
+import django.core.validators
+from django.db import migrations, models
+
+COLOR_FIELDS = ('primary_color', 'secondary_color', 'accent_color')
+
+
+def normalize_hex_colors(apps, schema_editor):
+    # The old fields took any string up to 7 chars; make existing rows satisfy
+    # the CHECK below. #rgb is expanded, anything else that isn't #rrggbb
+    # (names like "red", blanks) falls back to the field default.
+    SiteSettings = apps.get_model('main', 'SiteSettings')
+    for settings in SiteSettings.objects.all():
+        changed = []
+        for name in COLOR_FIELDS:
+            current = getattr(settings, name)
+            value = (current or '').strip()
+            if re.fullmatch(r'#[0-9a-fA-F]{3}', value):
+                value = '#' + ''.join(c * 2 for c in value[1:])
+            if not re.fullmatch(r'#[0-9a-fA-F]{6}', value):
+                value = SiteSettings._meta.get_field(name).default
+            if value != current:
+                setattr(settings, name, value)
+                changed.append(name)
+        if changed:
+            settings.save(update_fields=changed)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_project_tech_tags'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='accent_color',
+            field=models.CharField(default='#ffffff', help_text='Accent color (hex, e.g. #ffffff)', max_length=7, validators=[django.core.validators.RegexValidator('^#[0-9a-fA-F]{6}$', 'Enter a hex color, e.g. #b31919.')]),
+        ),
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='primary_color',
+            field=models.CharField(default='#b31919', help_text='Primary color (hex, e.g. #b31919)', max_length=7, validators=[django.core.validators.RegexValidator('^#[0-9a-fA-F]{6}$', 'Enter a hex color, e.g. #b31919.')]),
+        ),
+        migrations.AlterField(
+            model_name='sitesettings',
+            name='secondary_color',
+            field=models.CharField(default='#333333', help_text='Secondary color (hex, e.g. #333333)', max_length=7, validators=[django.core.validators.RegexValidator('^#[0-9a-fA-F]{6}$', 'Enter a hex color, e.g. #b31919.')]),
+        ),
+        migrations.RunPython(normalize_hex_colors, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='sitesettings',
+            constraint=models.CheckConstraint(condition=models.Q(('primary_color__regex', '^#[0-9a-fA-F]{6}$'), ('secondary_color__regex', '^#[0-9a-fA-F]{6}$'), ('accent_color__regex', '^#[0-9a-fA-F]{6}$')), name='site_settings_hex_colors', violation_error_message='Colors must be hex values like #b31919.'),
+        ),
+    ]
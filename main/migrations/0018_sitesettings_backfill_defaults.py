@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:20
+
+from django.db import migrations
+
+# Required CharFields older rows may have left blank. The hex colors are
+# already guaranteed non-blank by the site_settings_hex_colors constraint.
+FIELDS_WITH_DEFAULTS = (
+    'site_title',
+    'about_page_title',
+    'about_page_subtitle',
+    'experience_page_title',
+    'projects_page_title',
+    'contact_page_title',
+)
+
+
+def fill_blank_defaults(apps, schema_editor):
+    SiteSettings = apps.get_model('main', 'SiteSettings')
+    for name in FIELDS_WITH_DEFAULTS:
+        default = SiteSettings._meta.get_field(name).default
+        SiteSettings.objects.filter(**{name: ''}).update(**{name: default})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0017_created_at_db_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_blank_defaults, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0018_sitesettings_backfill_defaults'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='main_projec_is_feat_83a36d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-created_at'], name='project_featured_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:14
+
+from django.db import migrations, models
+
+
+def fill_skill_tags(apps, schema_editor):
+    # Historical models don't carry Profile.save(); mirror split_csv() + de-dupe here.
+    Profile = apps.get_model('main', 'Profile')
+    for profile in Profile.objects.all():
+        skills = (s.strip() for s in profile.skills.split(','))
+        profile.skill_tags = list(dict.fromkeys(s for s in skills if s))
+        profile.save(update_fields=['skill_tags'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0019_project_featured_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='skill_tags',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(fill_skill_tags, migrations.RunPython.noop),
+    ]
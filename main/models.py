@@ -1,9 +1,173 @@
 from __future__ import annotations
 
+import functools
+import secrets
+import time
+
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.core.validators import RegexValidator
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Now
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
 from django.utils.text import slugify
 
+from .themes import THEME_CHOICES, theme_colors
+
+
+SLUG_MAX_LENGTH = 50
+
+
+@functools.lru_cache(maxsize=1024)
+def _slugify_cached(title: str) -> str:
+    # Titles repeat across saves (admin edits, imports); slugify each only once.
+    return slugify(title)[:SLUG_MAX_LENGTH].rstrip("-") or "project"
+
+
+def split_csv(value: str) -> list[str]:
+    """Split a comma-separated field into stripped, non-empty items."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _source_written(instance: models.Model, source: str, update_fields) -> bool:
+    """
+    True if this save writes `source` with its value already loaded, i.e. a
+    field derived from it should be recomputed. Reading a deferred field would
+    cost an extra SELECT, and a save that doesn't write it can't change it.
+    """
+    if update_fields is None:
+        return source not in instance.get_deferred_fields()
+    return source in update_fields
+
+
+class CachedManager(models.Manager):
+    """
+    Manager for single-row models (Profile, SiteSettings).
+    get_singleton() memoizes the first row in Django's cache; the model
+    clears the key on save/delete via invalidate().
+    If `only` is given, just those columns are loaded (and cached) — keep it in
+    sync with what base.html reads, otherwise each extra field costs a query.
+    """
+
+    def __init__(self, cache_key: str, timeout: int = 300, only: tuple[str, ...] = ()):
+        super().__init__()
+        self.cache_key = cache_key
+        self.timeout = timeout
+        self.only_fields = only
+
+    def get_singleton(self):
+        return cache.get_or_set(self.cache_key, self._fetch_singleton, self.timeout)
+
+    def get_solo(self):
+        """
+        Like get_singleton(), but never None: with no row yet, return an unsaved
+        instance built from field defaults. Reads never write; the row is only
+        created by an explicit save (e.g. the dashboard settings editor).
+        """
+        obj = self.get_singleton()
+        if obj is None:
+            obj = self.model()
+        return obj
+
+    def _fetch_singleton(self):
+        qs = self.get_queryset()
+        if self.only_fields:
+            qs = qs.only(*self.only_fields)
+        return qs.first()
+
+    def invalidate(self) -> None:
+        cache.delete(self.cache_key)
+
+
+class ProjectManager(models.Manager):
+    def for_list(self):
+        """Projects for card/list pages; none of them render long_description."""
+        return self.defer("long_description")
+
+    def bulk_create_with_slugs(self, objs, batch_size: int = 1000):
+        """
+        bulk_create() for imports: bypasses Project.save(), so fill in slugs
+        and tech_tags here, using save()'s scheme: the plain base slug, or a
+        random suffix (Project._suffixed_slug) if it is taken. Taken bases are
+        fetched in one query and in-batch collisions resolved in memory; the
+        unique index stays the backstop. No post_save is sent, so the content
+        version is bumped here.
+        """
+        objs = list(objs)
+        bases = {_slugify_cached(o.title) for o in objs if not o.slug}
+        taken = {o.slug for o in objs if o.slug}
+        if bases:
+            taken.update(self.filter(slug__in=bases).values_list("slug", flat=True))
+        for obj in objs:
+            obj.tech_tags = split_csv(obj.tech_stack)
+            if obj.slug:
+                continue
+            base = slug = _slugify_cached(obj.title)
+            while slug in taken:
+                slug = self.model._suffixed_slug(base)
+            taken.add(slug)
+            obj.slug = slug
+        created = self.bulk_create(objs, batch_size=batch_size)
+        bump_content_version()
+        return created
+
+
+CONTENT_VERSION_KEY = "content:version"
+CONTENT_CACHE_TIMEOUT = 600
+
+
+def content_version() -> int:
+    """
+    Version stamp for cached template fragments built from portfolio content.
+    Stored in the shared default cache (settings.CACHES), so a bump in one
+    worker re-keys the fragments every worker renders.
+    """
+    return cache.get_or_set(CONTENT_VERSION_KEY, time.time_ns, CONTENT_CACHE_TIMEOUT)
+
+
+def bump_content_version() -> None:
+    cache.set(CONTENT_VERSION_KEY, time.time_ns(), CONTENT_CACHE_TIMEOUT)
+
+
+class ContentVersionMixin:
+    """
+    Marker for models whose writes bump content_version(), so {% cache %}
+    fragments keyed on it are rebuilt on the next render. Hooked to
+    post_save/post_delete, which also covers admin bulk deletes
+    (queryset.delete() sends post_delete per row). queryset.update() and
+    bulk_create() send neither; call bump_content_version() after them
+    (bulk_create_with_slugs() does), or fragments only expire on timeout.
+    """
+
+
+@receiver([post_save, post_delete])
+def _bump_content_version(sender, **kwargs) -> None:
+    if issubclass(sender, ContentVersionMixin):
+        bump_content_version()
+
+
+class CachedStrMixin:
+    """
+    Memoize __str__ per instance; admin renders it several times per object
+    (rows, breadcrumbs, history). Subclasses implement _build_display().
+    The memo is dropped on save so edited objects don't show stale names.
+    """
+
+    @cached_property
+    def _display(self) -> str:
+        return self._build_display()
+
+    def __str__(self) -> str:
+        return self._display
+
+    def save(self, *args, **kwargs):
+        self.__dict__.pop("_display", None)
+        super().save(*args, **kwargs)
+
 
 class Profile(models.Model):
     """
@@ -34,19 +198,50 @@ class Profile(models.Model):
     favicon_link = models.CharField(max_length=500, blank=True, help_text="Optional link or path to favicon if not uploading")
 
     skills = models.CharField(max_length=500, blank=True, help_text="Comma-separated skills/badges, e.g. 'Django, DRF Ready, SQA Mindset'")
+    # skills split and de-duplicated (order kept) on save; the badges read this.
+    skill_tags = models.JSONField(default=list, blank=True, editable=False)
 
     about = models.TextField(help_text="Short bio / summary")
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    # Full row: views and base.html share this one cached copy.
+    cache = CachedManager("profile:singleton")
+
     class Meta:
         verbose_name = "Profile"
         verbose_name_plural = "Profiles"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if _source_written(self, "skills", update_fields):
+            self.__dict__.pop("skill_list", None)
+            self.skill_tags = list(dict.fromkeys(self.skill_list))
+            self.__dict__.pop("unique_skill_list", None)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "skill_tags"}
+        super().save(*args, **kwargs)
+        Profile.cache.invalidate()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        Profile.cache.invalidate()
+        return result
+
+    @cached_property
+    def skill_list(self) -> tuple[str, ...]:
+        return tuple(split_csv(self.skills))
+
+    @cached_property
+    def unique_skill_list(self) -> tuple[str, ...]:
+        # Order-preserving de-dupe, done once in save().
+        return tuple(self.skill_tags)
+
     def __str__(self) -> str:
         return self.full_name
 
 
-class Experience(models.Model):
+class Experience(ContentVersionMixin, CachedStrMixin, models.Model):
     """
     Work/Leadership experience items.
     Supports ongoing roles via is_current=True (end_date should be empty in that case).
@@ -61,30 +256,66 @@ class Experience(models.Model):
     is_current = models.BooleanField(default=False)
 
     description = models.TextField(blank=True, help_text="Key responsibilities, impact, tools used.")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    # Denormalized "Jan 2023 – Present" label, rebuilt when a date field is saved.
+    display_period = models.CharField(max_length=32, blank=True, editable=False)
 
     class Meta:
         ordering = ["-start_date"]
-
-    def clean(self) -> None:
-        # If current, end_date should be empty
-        if self.is_current and self.end_date:
-            raise ValidationError("If 'is_current' is True, 'end_date' should be empty.")
-        # If not current, end_date should be provided (optional rule — comment out if not desired)
-        if not self.is_current and self.end_date and self.end_date < self.start_date:
-            raise ValidationError("'end_date' cannot be earlier than 'start_date'.")
+        indexes = [
+            models.Index(fields=["-start_date"]),
+            models.Index(fields=["-start_date"], condition=Q(is_current=True), name="idx_exp_current"),
+        ]
+        # Enforced by the DB; ModelForm/full_clean() still reports them as validation errors.
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(is_current=False) | Q(end_date__isnull=True),
+                name="exp_current_no_end",
+                violation_error_message="If 'is_current' is True, 'end_date' should be empty.",
+            ),
+            models.CheckConstraint(
+                condition=Q(end_date__isnull=True) | Q(end_date__gte=F("start_date")),
+                name="exp_end_after_start",
+                violation_error_message="'end_date' cannot be earlier than 'start_date'.",
+            ),
+        ]
+
+    PERIOD_FIELDS = ("start_date", "end_date", "is_current")
 
     def save(self, *args, **kwargs):
-        # Normalize: if is_current, force end_date to None
-        if self.is_current:
-            self.end_date = None
+        update_fields = kwargs.get("update_fields")
+        extra = set()
+
+        # Only touch the dates (and the label derived from them) when this save
+        # writes one of them; otherwise deferred dates would be fetched for nothing.
+        if any(_source_written(self, f, update_fields) for f in self.PERIOD_FIELDS):
+            # Normalize: if is_current, force end_date to None
+            if self.is_current and self.end_date is not None:
+                self.end_date = None
+                extra.add("end_date")
+
+            self.display_period = self.build_display_period()
+            extra.add("display_period")
+
+        if update_fields is not None:
+            # Only widen update_fields by columns this save actually touched.
+            kwargs["update_fields"] = {*update_fields, *extra}
         super().save(*args, **kwargs)
 
-    def __str__(self) -> str:
+    def build_display_period(self) -> str:
+        start = self.start_date.strftime("%b %Y")
+        if self.is_current:
+            return f"{start} – Present"
+        if self.end_date:
+            return f"{start} – {self.end_date.strftime('%b %Y')}"
+        return start
+
+    def _build_display(self) -> str:
         return f"{self.role} @ {self.organization}"
 
 
-class Education(models.Model):
+class Education(ContentVersionMixin, CachedStrMixin, models.Model):
     """
     Education history. end_year can be null for 'Present' if you want.
     """
@@ -101,23 +332,24 @@ class Education(models.Model):
 
     class Meta:
         ordering = ["-end_year", "-start_year"]
+        indexes = [models.Index(fields=["-end_year", "-start_year"])]
 
     def clean(self) -> None:
         if self.end_year is not None and self.end_year < self.start_year:
             raise ValidationError("'end_year' cannot be earlier than 'start_year'.")
 
-    def __str__(self) -> str:
+    def _build_display(self) -> str:
         return f"{self.degree} - {self.institution}"
 
 
-class Project(models.Model):
+class Project(ContentVersionMixin, CachedStrMixin, models.Model):
     """
     Portfolio projects.
     Slug is auto-generated from title if left blank.
     """
 
     title = models.CharField(max_length=150)
-    slug = models.SlugField(unique=True, blank=True)
+    slug = models.SlugField(max_length=SLUG_MAX_LENGTH, unique=True, blank=True)
 
     short_description = models.CharField(max_length=255)
     long_description = models.TextField(blank=True)
@@ -130,55 +362,125 @@ class Project(models.Model):
     github_url = models.URLField(blank=True)
     live_url = models.URLField(blank=True)
 
+    # tech_stack split into a list on save, so reads never re-parse the CSV.
+    tech_tags = models.JSONField(default=list, blank=True, editable=False)
+
     is_featured = models.BooleanField(default=False)
     image = models.ImageField(upload_to="projects/", blank=True, null=True)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    objects = ProjectManager()
+
+    # Plain slug, then random suffixes; racing saves can't both claim one.
+    SLUG_ATTEMPTS = 3
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            # Partial: only featured rows are stored, which is all the filter reads.
+            models.Index(
+                fields=["-created_at"],
+                name="project_featured_idx",
+                condition=Q(is_featured=True),
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored title/slug pair so an edit that clears the slug
+        # without renaming can restore it instead of re-deriving it.
+        loaded = instance.__dict__
+        if "title" in loaded and "slug" in loaded:
+            instance._loaded_slug = (instance.title, instance.slug)
+        return instance
 
     def save(self, *args, **kwargs):
         # Auto-create a unique slug from title if not provided.
-        if not self.slug:
-            base = slugify(self.title) or "project"
-            slug = base
-            counter = 1
-            while Project.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                counter += 1
-                slug = f"{base}-{counter}"
-            self.slug = slug
-        super().save(*args, **kwargs)
-
-    def __str__(self) -> str:
+        # The unique index is authoritative: try the plain slug first and, on a
+        # collision, retry with a short random suffix instead of querying for a
+        # free number. No SELECT-then-INSERT, so concurrent saves can't race.
+        update_fields = kwargs.get("update_fields")
+        if _source_written(self, "tech_stack", update_fields):
+            self.tech_tags = split_csv(self.tech_stack)
+            self.__dict__.pop("tech_list", None)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "tech_tags"}
+
+        # A save that doesn't write the slug (e.g. update_fields=["is_featured"]
+        # on an only() instance) leaves it alone, without reading deferred fields.
+        if not _source_written(self, "slug", update_fields):
+            super().save(*args, **kwargs)
+            self._remember_slug()
+            return
+
+        loaded = getattr(self, "_loaded_slug", None)
+        if not self.slug and loaded and loaded[0] == self.title:
+            self.slug = loaded[1]
+        if self.slug:
+            super().save(*args, **kwargs)
+            self._remember_slug()
+            return
+
+        base = _slugify_cached(self.title)
+        for attempt in range(self.SLUG_ATTEMPTS):
+            self.slug = base if attempt == 0 else self._suffixed_slug(base)
+            try:
+                # Savepoint so a collision doesn't break an outer transaction.
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                break
+            except IntegrityError:
+                if attempt == self.SLUG_ATTEMPTS - 1:
+                    raise
+        self._remember_slug()
+
+    def _remember_slug(self) -> None:
+        # Refresh the from_db() pair, but only from loaded values: touching a
+        # deferred title/slug here would cost a SELECT after every save.
+        if not {"title", "slug"} & self.get_deferred_fields():
+            self._loaded_slug = (self.title, self.slug)
+
+    @staticmethod
+    def _suffixed_slug(base: str) -> str:
+        suffix = secrets.token_hex(3)
+        return f"{base[:SLUG_MAX_LENGTH - len(suffix) - 1]}-{suffix}"
+
+    @cached_property
+    def tech_list(self) -> tuple[str, ...]:
+        return tuple(self.tech_tags)
+
+    def _build_display(self) -> str:
         return self.title
 
 
+@functools.cache
+def _theme_css(theme: str) -> str:
+    # The :root custom-property block for base.html, rendered once per theme.
+    return mark_safe("\n".join(
+        f"      --{key.replace('_', '-')}:{value};" for key, value in theme_colors(theme).items()
+    ))
+
+
+_HEX_COLOR_RE = r"^#[0-9a-fA-F]{6}$"
+_hex_color_validator = RegexValidator(_HEX_COLOR_RE, "Enter a hex color, e.g. #b31919.")
+
+
 class SiteSettings(models.Model):
     """
     Site-wide settings for customization.
     Single row expected.
     """
 
-    THEME_CHOICES = [
-        ('dark_red', 'Dark Red (Professional)'),
-        ('dark_blue', 'Dark Blue (Corporate)'),
-        ('dark_green', 'Dark Green (Nature)'),
-        ('dark_purple', 'Dark Purple (Creative)'),
-        ('ocean_deep', 'Ocean Deep (Calm)'),
-        ('sunset_orange', 'Sunset Orange (Warm)'),
-        ('forest_dark', 'Forest Dark (Organic)'),
-        ('royal_purple', 'Royal Purple (Elegant)'),
-        ('cyberpunk', 'Cyberpunk (Futuristic)'),
-        ('midnight_blue', 'Midnight Blue (Deep)'),
-        ('default', 'Default (Reset to Original)'),
-    ]
+    THEME_CHOICES = THEME_CHOICES
 
     site_title = models.CharField(max_length=100, default="Tawfiq Hassan Nayem", help_text="Site title for browser tab")
     theme = models.CharField(max_length=20, choices=THEME_CHOICES, default='dark_red', help_text="Choose a color theme for the entire site")
-    primary_color = models.CharField(max_length=7, default="#b31919", help_text="Primary color (hex, e.g. #b31919)")
-    secondary_color = models.CharField(max_length=7, default="#333333", help_text="Secondary color (hex, e.g. #333333)")
-    accent_color = models.CharField(max_length=7, default="#ffffff", help_text="Accent color (hex, e.g. #ffffff)")
+    primary_color = models.CharField(max_length=7, default="#b31919", validators=[_hex_color_validator], help_text="Primary color (hex, e.g. #b31919)")
+    secondary_color = models.CharField(max_length=7, default="#333333", validators=[_hex_color_validator], help_text="Secondary color (hex, e.g. #333333)")
+    accent_color = models.CharField(max_length=7, default="#ffffff", validators=[_hex_color_validator], help_text="Accent color (hex, e.g. #ffffff)")
 
     # Additional page content
     about_page_title = models.CharField(max_length=100, default="About Me", help_text="Title for About page")
@@ -193,523 +495,60 @@ class SiteSettings(models.Model):
 
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    # Everything but the four *_page_content bodies; a page that renders its
+    # body loads just that column on access (one single-column SELECT).
+    cache = CachedManager(
+        "site_settings:singleton",
+        only=(
+            "site_title",
+            "theme",
+            "primary_color",
+            "secondary_color",
+            "accent_color",
+            "about_page_title",
+            "about_page_subtitle",
+            "experience_page_title",
+            "projects_page_title",
+            "contact_page_title",
+        ),
+    )
+
     class Meta:
         verbose_name = "Site Settings"
         verbose_name_plural = "Site Settings"
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(primary_color__regex=_HEX_COLOR_RE)
+                & Q(secondary_color__regex=_HEX_COLOR_RE)
+                & Q(accent_color__regex=_HEX_COLOR_RE),
+                name="site_settings_hex_colors",
+                violation_error_message="Colors must be hex values like #b31919.",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        SiteSettings.cache.invalidate()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        SiteSettings.cache.invalidate()
+        return result
 
     def get_theme_colors(self):
         """Return comprehensive theme colors based on selected theme"""
-        themes = {
-            'dark_red': {
-                # Primary colors
-                'primary': '#b31919',
-                'secondary': '#8b0000',
-                'accent': '#ffffff',
-
-                # Background layers
-                'bg0': '#0b0b0d',      # Main background
-                'bg1': '#111115',      # Secondary background
-                'bg2': '#1a1a1f',      # Tertiary background
-                'navbar_bg': 'rgba(10,10,14,.85)',  # Navbar background
-                'card': '#14141a',     # Card backgrounds
-                'card_hover': '#1a1a20', # Card hover state
-                'footer_bg': 'rgba(20,20,26,.95)', # Footer background
-
-                # Text colors
-                'text': '#e9e9ee',     # Primary text
-                'text_secondary': '#d1d1d6', # Secondary text
-                'muted': '#b5b5c2',   # Muted text
-                'muted_light': '#9a9aad', # Lighter muted text
-                'navbar_text': '#e9e9ee', # Navbar text
-                'navbar_muted': '#b5b5c2', # Navbar muted text
-
-                # Border and separator colors
-                'border': '#262633',  # Primary borders
-                'border_light': '#3a3a4a', # Light borders
-                'divider': 'rgba(38,38,51,.9)', # Dividers
-
-                # Interactive elements
-                'btn_primary': 'linear-gradient(180deg, #b31919, #8b0000)',
-                'btn_primary_hover': 'linear-gradient(180deg, #c82323, #990000)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-
-                # Special elements
-                'glow': 'rgba(179,19,19,.35)', # Glow effects
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(179,19,19,.75), transparent)',
-                'badge_bg': 'rgba(179,19,19,.12)',
-                'badge_border': 'rgba(179,19,19,.25)',
-                'badge_text': '#ffd0d0',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#b5b5c2',
-
-                # Links
-                'link': '#ffb3b3',
-                'link_hover': '#ffd0d0',
-
-                # Form elements
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(179,19,19,.55)',
-                'form_focus_shadow': 'rgba(179,19,19,.18)',
-
-                # Timeline
-                'timeline_line': 'rgba(179,19,19,.35)',
-                'timeline_dot': '#b31919',
-                'timeline_glow': 'rgba(179,19,19,.35)',
-            },
-            'dark_blue': {
-                'primary': '#1e40af',
-                'secondary': '#1e3a8a',
-                'accent': '#ffffff',
-                'bg0': '#0f172a',
-                'bg1': '#1e293b',
-                'bg2': '#334155',
-                'navbar_bg': 'rgba(15,23,42,.85)',
-                'card': '#1e293b',
-                'card_hover': '#334155',
-                'footer_bg': 'rgba(30,41,59,.95)',
-                'text': '#f1f5f9',
-                'text_secondary': '#e2e8f0',
-                'muted': '#94a3b8',
-                'muted_light': '#cbd5e1',
-                'navbar_text': '#f1f5f9',
-                'navbar_muted': '#94a3b8',
-                'border': '#475569',
-                'border_light': '#64748b',
-                'divider': 'rgba(71,85,105,.9)',
-                'btn_primary': 'linear-gradient(180deg, #1e40af, #1e3a8a)',
-                'btn_primary_hover': 'linear-gradient(180deg, #2563eb, #1d4ed8)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(30,64,175,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(30,64,175,.75), transparent)',
-                'badge_bg': 'rgba(30,64,175,.12)',
-                'badge_border': 'rgba(30,64,175,.25)',
-                'badge_text': '#bfdbfe',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#94a3b8',
-                'link': '#93c5fd',
-                'link_hover': '#bfdbfe',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(30,64,175,.55)',
-                'form_focus_shadow': 'rgba(30,64,175,.18)',
-                'timeline_line': 'rgba(30,64,175,.35)',
-                'timeline_dot': '#1e40af',
-                'timeline_glow': 'rgba(30,64,175,.35)',
-            },
-            'dark_green': {
-                'primary': '#059669',
-                'secondary': '#047857',
-                'accent': '#ffffff',
-                'bg0': '#064e3b',
-                'bg1': '#065f46',
-                'bg2': '#0f766e',
-                'navbar_bg': 'rgba(6,78,59,.85)',
-                'card': '#065f46',
-                'card_hover': '#0f766e',
-                'footer_bg': 'rgba(6,95,70,.95)',
-                'text': '#ecfdf5',
-                'text_secondary': '#d1fae5',
-                'muted': '#6ee7b7',
-                'muted_light': '#a7f3d0',
-                'navbar_text': '#ecfdf5',
-                'navbar_muted': '#6ee7b7',
-                'border': '#10b981',
-                'border_light': '#34d399',
-                'divider': 'rgba(16,185,129,.9)',
-                'btn_primary': 'linear-gradient(180deg, #059669, #047857)',
-                'btn_primary_hover': 'linear-gradient(180deg, #10b981, #059669)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(5,150,105,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(5,150,105,.75), transparent)',
-                'badge_bg': 'rgba(5,150,105,.12)',
-                'badge_border': 'rgba(5,150,105,.25)',
-                'badge_text': '#d1fae5',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#6ee7b7',
-                'link': '#6ee7b7',
-                'link_hover': '#a7f3d0',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(5,150,105,.55)',
-                'form_focus_shadow': 'rgba(5,150,105,.18)',
-                'timeline_line': 'rgba(5,150,105,.35)',
-                'timeline_dot': '#059669',
-                'timeline_glow': 'rgba(5,150,105,.35)',
-            },
-            'dark_purple': {
-                'primary': '#7c3aed',
-                'secondary': '#6d28d9',
-                'accent': '#ffffff',
-                'bg0': '#2d1b69',
-                'bg1': '#3730a3',
-                'bg2': '#4c1d95',
-                'navbar_bg': 'rgba(45,27,105,.85)',
-                'card': '#3730a3',
-                'card_hover': '#4c1d95',
-                'footer_bg': 'rgba(55,48,163,.95)',
-                'text': '#f3e8ff',
-                'text_secondary': '#e9d5ff',
-                'muted': '#c4b5fd',
-                'muted_light': '#ddd6fe',
-                'navbar_text': '#f3e8ff',
-                'navbar_muted': '#c4b5fd',
-                'border': '#8b5cf6',
-                'border_light': '#a78bfa',
-                'divider': 'rgba(139,92,246,.9)',
-                'btn_primary': 'linear-gradient(180deg, #7c3aed, #6d28d9)',
-                'btn_primary_hover': 'linear-gradient(180deg, #8b5cf6, #7c3aed)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(124,58,237,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(124,58,237,.75), transparent)',
-                'badge_bg': 'rgba(124,58,237,.12)',
-                'badge_border': 'rgba(124,58,237,.25)',
-                'badge_text': '#e9d5ff',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#c4b5fd',
-                'link': '#c4b5fd',
-                'link_hover': '#ddd6fe',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(124,58,237,.55)',
-                'form_focus_shadow': 'rgba(124,58,237,.18)',
-                'timeline_line': 'rgba(124,58,237,.35)',
-                'timeline_dot': '#7c3aed',
-                'timeline_glow': 'rgba(124,58,237,.35)',
-            },
-            'ocean_deep': {
-                'primary': '#0ea5e9',
-                'secondary': '#0284c7',
-                'accent': '#ffffff',
-                'bg0': '#0c4a6e',
-                'bg1': '#075985',
-                'bg2': '#0369a1',
-                'navbar_bg': 'rgba(12,74,110,.85)',
-                'card': '#075985',
-                'card_hover': '#0369a1',
-                'footer_bg': 'rgba(7,89,133,.95)',
-                'text': '#f0f9ff',
-                'text_secondary': '#e0f2fe',
-                'muted': '#7dd3fc',
-                'muted_light': '#bae6fd',
-                'navbar_text': '#f0f9ff',
-                'navbar_muted': '#7dd3fc',
-                'border': '#0ea5e9',
-                'border_light': '#38bdf8',
-                'divider': 'rgba(14,165,233,.9)',
-                'btn_primary': 'linear-gradient(180deg, #0ea5e9, #0284c7)',
-                'btn_primary_hover': 'linear-gradient(180deg, #38bdf8, #0ea5e9)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(14,165,233,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(14,165,233,.75), transparent)',
-                'badge_bg': 'rgba(14,165,233,.12)',
-                'badge_border': 'rgba(14,165,233,.25)',
-                'badge_text': '#bae6fd',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#7dd3fc',
-                'link': '#7dd3fc',
-                'link_hover': '#bae6fd',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(14,165,233,.55)',
-                'form_focus_shadow': 'rgba(14,165,233,.18)',
-                'timeline_line': 'rgba(14,165,233,.35)',
-                'timeline_dot': '#0ea5e9',
-                'timeline_glow': 'rgba(14,165,233,.35)',
-            },
-            'sunset_orange': {
-                'primary': '#ea580c',
-                'secondary': '#c2410c',
-                'accent': '#ffffff',
-                'bg0': '#7c2d12',
-                'bg1': '#9a3412',
-                'bg2': '#c2410c',
-                'navbar_bg': 'rgba(124,45,18,.85)',
-                'card': '#9a3412',
-                'card_hover': '#c2410c',
-                'footer_bg': 'rgba(154,52,18,.95)',
-                'text': '#fff7ed',
-                'text_secondary': '#fed7aa',
-                'muted': '#fdba74',
-                'muted_light': '#fed7aa',
-                'navbar_text': '#fff7ed',
-                'navbar_muted': '#fdba74',
-                'border': '#ea580c',
-                'border_light': '#f97316',
-                'divider': 'rgba(234,88,12,.9)',
-                'btn_primary': 'linear-gradient(180deg, #ea580c, #c2410c)',
-                'btn_primary_hover': 'linear-gradient(180deg, #f97316, #ea580c)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(234,88,12,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(234,88,12,.75), transparent)',
-                'badge_bg': 'rgba(234,88,12,.12)',
-                'badge_border': 'rgba(234,88,12,.25)',
-                'badge_text': '#fed7aa',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#fdba74',
-                'link': '#fdba74',
-                'link_hover': '#fed7aa',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(234,88,12,.55)',
-                'form_focus_shadow': 'rgba(234,88,12,.18)',
-                'timeline_line': 'rgba(234,88,12,.35)',
-                'timeline_dot': '#ea580c',
-                'timeline_glow': 'rgba(234,88,12,.35)',
-            },
-            'forest_dark': {
-                'primary': '#166534',
-                'secondary': '#14532d',
-                'accent': '#ffffff',
-                'bg0': '#1a2e05',
-                'bg1': '#365314',
-                'bg2': '#4d7c0f',
-                'navbar_bg': 'rgba(26,46,5,.85)',
-                'card': '#365314',
-                'card_hover': '#4d7c0f',
-                'footer_bg': 'rgba(54,83,20,.95)',
-                'text': '#f7fee7',
-                'text_secondary': '#ecfccb',
-                'muted': '#bef264',
-                'muted_light': '#d9f99d',
-                'navbar_text': '#f7fee7',
-                'navbar_muted': '#bef264',
-                'border': '#65a30d',
-                'border_light': '#84cc16',
-                'divider': 'rgba(101,163,13,.9)',
-                'btn_primary': 'linear-gradient(180deg, #166534, #14532d)',
-                'btn_primary_hover': 'linear-gradient(180deg, #22c55e, #16a34a)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(22,163,74,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(22,163,74,.75), transparent)',
-                'badge_bg': 'rgba(22,163,74,.12)',
-                'badge_border': 'rgba(22,163,74,.25)',
-                'badge_text': '#d9f99d',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#bef264',
-                'link': '#bef264',
-                'link_hover': '#d9f99d',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(22,163,74,.55)',
-                'form_focus_shadow': 'rgba(22,163,74,.18)',
-                'timeline_line': 'rgba(22,163,74,.35)',
-                'timeline_dot': '#166534',
-                'timeline_glow': 'rgba(22,163,74,.35)',
-            },
-            'royal_purple': {
-                'primary': '#581c87',
-                'secondary': '#4c1d95',
-                'accent': '#ffffff',
-                'bg0': '#2d1b69',
-                'bg1': '#4c1d95',
-                'bg2': '#6d28d9',
-                'navbar_bg': 'rgba(45,27,105,.85)',
-                'card': '#4c1d95',
-                'card_hover': '#6d28d9',
-                'footer_bg': 'rgba(76,29,149,.95)',
-                'text': '#faf5ff',
-                'text_secondary': '#f3e8ff',
-                'muted': '#d8b4fe',
-                'muted_light': '#e9d5ff',
-                'navbar_text': '#faf5ff',
-                'navbar_muted': '#d8b4fe',
-                'border': '#7c3aed',
-                'border_light': '#8b5cf6',
-                'divider': 'rgba(124,58,237,.9)',
-                'btn_primary': 'linear-gradient(180deg, #581c87, #4c1d95)',
-                'btn_primary_hover': 'linear-gradient(180deg, #7c3aed, #6d28d9)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(88,28,135,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(88,28,135,.75), transparent)',
-                'badge_bg': 'rgba(88,28,135,.12)',
-                'badge_border': 'rgba(88,28,135,.25)',
-                'badge_text': '#e9d5ff',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#d8b4fe',
-                'link': '#d8b4fe',
-                'link_hover': '#e9d5ff',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(88,28,135,.55)',
-                'form_focus_shadow': 'rgba(88,28,135,.18)',
-                'timeline_line': 'rgba(88,28,135,.35)',
-                'timeline_dot': '#581c87',
-                'timeline_glow': 'rgba(88,28,135,.35)',
-            },
-            'cyberpunk': {
-                'primary': '#00ff88',
-                'secondary': '#00cc66',
-                'accent': '#ffffff',
-                'bg0': '#0a0a0a',
-                'bg1': '#1a1a1a',
-                'bg2': '#2a2a2a',
-                'navbar_bg': 'rgba(10,10,10,.85)',
-                'card': '#1a1a1a',
-                'card_hover': '#2a2a2a',
-                'footer_bg': 'rgba(26,26,26,.95)',
-                'text': '#ffffff',
-                'text_secondary': '#f0f0f0',
-                'muted': '#00ff88',
-                'muted_light': '#33ff99',
-                'navbar_text': '#ffffff',
-                'navbar_muted': '#00ff88',
-                'border': '#00ff88',
-                'border_light': '#33ff99',
-                'divider': 'rgba(0,255,136,.9)',
-                'btn_primary': 'linear-gradient(180deg, #00ff88, #00cc66)',
-                'btn_primary_hover': 'linear-gradient(180deg, #33ff99, #00ff88)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(0,255,136,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(0,255,136,.75), transparent)',
-                'badge_bg': 'rgba(0,255,136,.12)',
-                'badge_border': 'rgba(0,255,136,.25)',
-                'badge_text': '#33ff99',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#00ff88',
-                'link': '#00ff88',
-                'link_hover': '#33ff99',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(0,255,136,.55)',
-                'form_focus_shadow': 'rgba(0,255,136,.18)',
-                'timeline_line': 'rgba(0,255,136,.35)',
-                'timeline_dot': '#00ff88',
-                'timeline_glow': 'rgba(0,255,136,.35)',
-            },
-            'midnight_blue': {
-                'primary': '#1e1b4b',
-                'secondary': '#312e81',
-                'accent': '#ffffff',
-                'bg0': '#0f0a1a',
-                'bg1': '#1e1b4b',
-                'bg2': '#312e81',
-                'navbar_bg': 'rgba(15,10,26,.85)',
-                'card': '#1e1b4b',
-                'card_hover': '#312e81',
-                'footer_bg': 'rgba(30,27,75,.95)',
-                'text': '#f8fafc',
-                'text_secondary': '#e2e8f0',
-                'muted': '#a5b4fc',
-                'muted_light': '#c7d2fe',
-                'navbar_text': '#f8fafc',
-                'navbar_muted': '#a5b4fc',
-                'border': '#6366f1',
-                'border_light': '#818cf8',
-                'divider': 'rgba(99,102,241,.9)',
-                'btn_primary': 'linear-gradient(180deg, #1e1b4b, #312e81)',
-                'btn_primary_hover': 'linear-gradient(180deg, #3730a3, #4338ca)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.08)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(30,27,75,.35)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(30,27,75,.75), transparent)',
-                'badge_bg': 'rgba(30,27,75,.12)',
-                'badge_border': 'rgba(30,27,75,.25)',
-                'badge_text': '#c7d2fe',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#a5b4fc',
-                'link': '#a5b4fc',
-                'link_hover': '#c7d2fe',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(30,27,75,.55)',
-                'form_focus_shadow': 'rgba(30,27,75,.18)',
-                'timeline_line': 'rgba(30,27,75,.35)',
-                'timeline_dot': '#1e1b4b',
-                'timeline_glow': 'rgba(30,27,75,.35)',
-            },
-            'default': {
-                # Original hardcoded values from the CSS
-                'primary': '#b31919',
-                'secondary': '#8b0000',
-                'accent': '#ffffff',
-                'bg0': '#0b0b0d',
-                'bg1': '#111115',
-                'bg2': '#1a1a1f',
-                'navbar_bg': 'rgba(10,10,14,.55)',
-                'card': 'linear-gradient(180deg, rgba(20,20,26,.96), rgba(16,16,22,.92))',
-                'card_hover': 'linear-gradient(180deg, rgba(20,20,26,.96), rgba(16,16,22,.92))',
-                'footer_bg': 'rgba(20,20,26,.95)',
-                'text': '#e9e9ee',
-                'text_secondary': '#d1d1d6',
-                'muted': '#b5b5c2',
-                'muted_light': '#9a9aad',
-                'navbar_text': '#e9e9ee',
-                'navbar_muted': '#b5b5c2',
-                'border': 'rgba(38,38,51,.6)',
-                'border_light': '#3a3a4a',
-                'divider': 'rgba(38,38,51,.9)',
-                'btn_primary': 'linear-gradient(180deg, #b31919, #8b0000)',
-                'btn_primary_hover': 'linear-gradient(180deg, #c82323, #990000)',
-                'btn_ghost': 'rgba(255,255,255,.03)',
-                'btn_ghost_hover': 'rgba(255,255,255,.06)',
-                'btn_ghost_border': 'rgba(255,255,255,.12)',
-                'glow': 'rgba(179,19,19,.22)',
-                'glow_line': 'linear-gradient(90deg, transparent, rgba(179,19,19,.75), transparent)',
-                'badge_bg': 'rgba(179,19,19,.12)',
-                'badge_border': 'rgba(179,19,19,.25)',
-                'badge_text': '#ffd0d0',
-                'pill_bg': 'rgba(255,255,255,.03)',
-                'pill_border': 'rgba(255,255,255,.12)',
-                'pill_text': '#b5b5c2',
-                'link': '#ffb3b3',
-                'link_hover': '#ffd0d0',
-                'form_bg': 'rgba(255,255,255,.04)',
-                'form_border': 'rgba(255,255,255,.10)',
-                'form_focus_bg': 'rgba(255,255,255,.05)',
-                'form_focus_border': 'rgba(179,19,19,.55)',
-                'form_focus_shadow': 'rgba(179,19,19,.18)',
-                'timeline_line': 'rgba(179,19,19,.35)',
-                'timeline_dot': '#b31919',
-                'timeline_glow': 'rgba(179,19,19,.35)',
-            },
-        }
-        return themes.get(self.theme, themes['dark_red'])
+        return theme_colors(self.theme)
+
+    @property
+    def theme_css(self) -> str:
+        return _theme_css(self.theme)
 
     def __str__(self) -> str:
         return "Site Settings"
 
 
-class ContactMessage(models.Model):
+class ContactMessage(CachedStrMixin, models.Model):
     """
     Contact form submissions.
     Stored in DB so you can view/manage in Django Admin.
@@ -721,10 +560,14 @@ class ContactMessage(models.Model):
     message = models.TextField()
 
     is_read = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["is_read", "-created_at"]),
+        ]
 
-    def __str__(self) -> str:
+    def _build_display(self) -> str:
         return f"{self.name} - {self.subject}"
@@ -1,3 +1,112 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from .forms import ExperienceForm
+from .models import Experience, Profile, Project, SiteSettings, content_version
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProjectSlugTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_plain_slug_from_title(self):
+        project = Project.objects.create(title="Portfolio Site")
+        self.assertEqual(project.slug, "portfolio-site")
+
+    def test_collision_retries_with_suffix(self):
+        first = Project.objects.create(title="Portfolio Site")
+        second = Project.objects.create(title="Portfolio Site")
+        self.assertNotEqual(first.slug, second.slug)
+        self.assertRegex(second.slug, r"^portfolio-site-[0-9a-f]{6}$")
+
+    def test_collision_keeps_outer_transaction_usable(self):
+        Project.objects.create(title="Portfolio Site")
+        with transaction.atomic():
+            Project.objects.create(title="Portfolio Site")
+            # The failed INSERT was rolled back to its savepoint only.
+            self.assertEqual(Project.objects.count(), 2)
+
+    def test_slug_is_truncated_to_max_length(self):
+        project = Project.objects.create(title="x" * 80)
+        self.assertEqual(len(project.slug), 50)
+
+    def test_cleared_slug_is_restored_when_title_unchanged(self):
+        Project.objects.create(title="Portfolio Site")
+        project = Project.objects.get()
+        project.slug = ""
+        project.save()
+        self.assertEqual(project.slug, "portfolio-site")
+
+    def test_bulk_create_with_slugs(self):
+        Project.objects.create(title="Portfolio Site")
+        version = content_version()
+        created = Project.objects.bulk_create_with_slugs(
+            [Project(title="Portfolio Site"), Project(title="Portfolio Site", tech_stack="Django, HTMX")]
+        )
+        slugs = {p.slug for p in created}
+        self.assertEqual(len(slugs), 2)
+        self.assertNotIn("portfolio-site", slugs)
+        self.assertEqual(created[1].tech_tags, ["Django", "HTMX"])
+        self.assertNotEqual(content_version(), version)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_profile_cache_cleared_on_save_and_delete(self):
+        profile = Profile.objects.create(full_name="A", headline="H", email="a@example.com", about="Bio")
+        self.assertEqual(Profile.cache.get_singleton().full_name, "A")
+        profile.full_name = "B"
+        profile.save()
+        self.assertEqual(Profile.cache.get_singleton().full_name, "B")
+        profile.delete()
+        self.assertIsNone(Profile.cache.get_singleton())
+
+    def test_site_settings_cache_cleared_on_save(self):
+        self.assertIsNone(SiteSettings.cache.get_singleton())
+        settings = SiteSettings.cache.get_solo()
+        # Reading doesn't create the row.
+        self.assertFalse(SiteSettings.objects.exists())
+        settings.site_title = "Changed"
+        settings.save()
+        self.assertEqual(SiteSettings.cache.get_singleton().site_title, "Changed")
+
+    def test_content_version_bumped_on_save_and_delete(self):
+        version = content_version()
+        project = Project.objects.create(title="Portfolio Site")
+        self.assertNotEqual(content_version(), version)
+        version = content_version()
+        project.delete()
+        self.assertNotEqual(content_version(), version)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ExperienceTests(TestCase):
+    def test_display_period(self):
+        exp = Experience.objects.create(
+            role="Dev", organization="Org", start_date=datetime.date(2023, 1, 1), is_current=True
+        )
+        self.assertEqual(exp.display_period, "Jan 2023 – Present")
+        exp.is_current = False
+        exp.end_date = datetime.date(2024, 6, 1)
+        exp.save(update_fields=["is_current", "end_date"])
+        exp.refresh_from_db()
+        self.assertEqual(exp.display_period, "Jan 2023 – Jun 2024")
+
+    def test_end_before_start_is_a_form_error(self):
+        form = ExperienceForm(data={
+            "role": "Dev",
+            "organization": "Org",
+            "start_date": "2023-05-01",
+            "end_date": "2023-01-01",
+        })
+        self.assertFalse(form.is_valid())
+        self.assertIn("'end_date' cannot be earlier than 'start_date'.", form.non_field_errors())
@@ -2,13 +2,28 @@ from __future__ import annotations
 
 from django.shortcuts import render, redirect
 from django.contrib import messages
-
-from .models import Profile, Experience, Education, Project, ContactMessage, SiteSettings
+from django.core.cache import cache
+
+from .models import (
+    CONTENT_CACHE_TIMEOUT,
+    ContactMessage,
+    Education,
+    Experience,
+    Profile,
+    Project,
+    SiteSettings,
+    content_version,
+)
 
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import get_object_or_404
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject
+from django.views.generic import CreateView, DeleteView, UpdateView
+from django.views.decorators.http import require_http_methods
 from .forms import ProfileForm, ProjectForm, EducationForm, ExperienceForm, SiteSettingsForm
 
+
 def home_view(request):
     """
     Home page view.
@@ -18,21 +33,15 @@ def home_view(request):
     - Recent experience
     - Education
     - Featured projects
-    - All projects count / preview
     """
-    profile = Profile.objects.first()
-    if profile and profile.skills:
-        skills_list = [skill.strip() for skill in profile.skills.split(',')]
-    else:
-        skills_list = []
+    profile = request.profile
 
     context = {
         "profile": profile,                     # Portfolio owner
-        "skills_list": skills_list,            # Split skills for template
+        "skills_list": profile.skill_list if profile else (),  # Parsed once per instance
         "experiences": Experience.objects.all(),               # Work / leadership history
         "educations": Education.objects.all(),                 # Academic background
-        "featured_projects": Project.objects.filter(is_featured=True),
-        "all_projects": Project.objects.all(),
+        "featured_projects": Project.objects.for_list().filter(is_featured=True),
     }
     return render(request, "home.html", context)
 
@@ -45,16 +54,12 @@ def about_view(request):
     - Profile bio / summary
     - Education history
     """
-    profile = Profile.objects.first()
-    if profile and profile.skills:
-        skills_list = list(set(skill.strip() for skill in profile.skills.split(',')))
-    else:
-        skills_list = []
+    profile = request.profile
 
     context = {
         "profile": profile,
-        "skills_list": skills_list,
-        "educations": Education.objects.all(),
+        "skills_list": profile.unique_skill_list if profile else (),
+        "educations": Education.objects.only("degree", "institution", "start_year", "end_year", "result_or_cgpa"),
     }
     return render(request, "about.html", context)
 
@@ -68,10 +73,9 @@ def experience_view(request):
     - Education summary (optional sidebar)
     """
     context = {
-        "profile": Profile.objects.first(),
-        "site_settings": SiteSettings.objects.first(),
+        "profile": request.profile,
         "experiences": Experience.objects.all(),
-        "educations": Education.objects.all(),
+        "educations": Education.objects.only("degree", "institution")[:3],  # sidebar shows the latest three
     }
     return render(request, "experience.html", context)
 
@@ -84,11 +88,13 @@ def projects_view(request):
     - All projects
     - Highlights featured projects separately
     """
+    # Both stay lazy: when the grid fragment is cached neither is touched, so
+    # the query never runs. Otherwise one query; featured is partitioned from it.
+    projects = Project.objects.for_list()
     context = {
-        "profile": Profile.objects.first(),
-        "site_settings": SiteSettings.objects.first(),
-        "projects": Project.objects.all(),
-        "featured_projects": Project.objects.filter(is_featured=True),
+        "profile": request.profile,
+        "projects": projects,
+        "featured_projects": SimpleLazyObject(lambda: [p for p in projects if p.is_featured]),
     }
     return render(request, "projects.html", context)
 
@@ -102,8 +108,7 @@ def contact_view(request):
     - Saving submitted messages to the database
     - Showing success / error feedback messages
     """
-    profile = Profile.objects.first()
-    site_settings = SiteSettings.objects.first()
+    profile = request.profile
 
     if request.method == "POST":
         # Safely extract and clean form data
@@ -115,7 +120,7 @@ def contact_view(request):
         # Basic validation (kept simple for portfolio use)
         if not name or not email or not message:
             messages.error(request, "Please fill in all required fields.")
-            return redirect("contact")
+            return redirect("main:contact")
 
         # Persist message to database (viewable in Admin)
         ContactMessage.objects.create(
@@ -129,9 +134,9 @@ def contact_view(request):
             request,
             "Message sent successfully! I’ll get back to you soon.",
         )
-        return redirect("contact")
+        return redirect("main:contact")
 
-    return render(request, "contact.html", {"profile": profile, "site_settings": site_settings})
+    return render(request, "contact.html", {"profile": profile})
 
 
 def dashboard_view(request):
@@ -139,21 +144,35 @@ def dashboard_view(request):
     Hidden dashboard: overview + quick links.
     Only logged-in users can access.
     """
-    profile = Profile.objects.first()
-    site_settings = SiteSettings.objects.first()
     context = {
-        "profile": profile,
-        "site_settings": site_settings,
-        "projects": Project.objects.all(),
-        "featured_projects": Project.objects.filter(is_featured=True),
-        "experiences": Experience.objects.all(),
-        "educations": Education.objects.all(),
-        }
+        "profile": request.profile,
+        **_dashboard_summary(),
+    }
 
     return render(request, "dashboard/dashboard.html", context)
 
 
+def _dashboard_summary() -> dict:
+    """
+    The dashboard's project/experience/education lists, cached as one payload.
+    Keyed on content_version(), which lives in the shared cache, so any
+    add/edit/delete shows up on the next request in every worker.
+    """
+
+    def build():
+        projects = list(Project.objects.for_list())
+        return {
+            "projects": projects,
+            "featured_projects": [p for p in projects if p.is_featured],
+            "experiences": list(Experience.objects.all()),
+            "educations": list(Education.objects.all()),
+        }
+
+    return cache.get_or_set(f"dashboard:summary:{content_version()}", build, CONTENT_CACHE_TIMEOUT)
+
+
 @login_required
+@require_http_methods(["GET", "POST"])
 def dashboard_profile_edit_view(request):
     """
     Edit your Profile from frontend.
@@ -184,213 +203,117 @@ def dashboard_profile_edit_view(request):
     )
 
 
-@login_required
-def dashboard_project_add_view(request):
-    """
-    Add a new Project from frontend.
-    """
-    if request.method == "POST":
-        form = ProjectForm(request.POST, request.FILES)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Project added successfully.")
-            return redirect("main:dashboard")
-    else:
-        form = ProjectForm()
-
-    return render(request, "dashboard/project_form.html", {"form": form, "mode": "add"})
-
-
-@login_required
-def dashboard_project_edit_view(request, pk: int):
-    """
-    Edit an existing Project from frontend.
-    """
-    project = get_object_or_404(Project, pk=pk)
-
-    if request.method == "POST":
-        form = ProjectForm(request.POST, request.FILES, instance=project)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Project updated successfully.")
-            return redirect("main:dashboard")
-    else:
-        form = ProjectForm(instance=project)
-
-    return render(
-        request,
-        "dashboard/project_form.html",
-        {"form": form, "mode": "edit", "project": project},
-    )
-
-
-@login_required
-def dashboard_project_delete_view(request, pk: int):
+class DashboardCRUDMixin(LoginRequiredMixin):
     """
-    Confirm + delete a Project.
+    Shared plumbing for the dashboard add/edit/delete pages.
+    Subclasses set model/form_class/template_name plus the flash messages;
+    `queryset` is where per-page column trimming goes.
     """
-    project = get_object_or_404(Project, pk=pk)
-
-    if request.method == "POST":
-        project.delete()
-        messages.success(request, "Project deleted successfully.")
-        return redirect("main:dashboard")
-
-    return render(request, "dashboard/project_delete.html", {"project": project})
 
+    http_method_names = ["get", "post"]
+    success_url = reverse_lazy("main:dashboard")
+    success_message = ""
+    invalid_message = ""  # flashed when the form doesn't validate
+    mode = ""
 
-@login_required
-def dashboard_education_add_view(request):
-    """
-    Dashboard: Add a new Education entry.
-    Only accessible to authenticated users.
-    """
-    profile = Profile.objects.first()
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["profile"] = self.request.profile
+        context["mode"] = self.mode
+        return context
 
-    if request.method == "POST":
-        form = EducationForm(request.POST)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Education added successfully.")
-            return redirect("main:dashboard")
-        messages.error(request, "Please correct the errors below.")
-    else:
-        form = EducationForm()
+    def form_valid(self, form):
+        response = super().form_valid(form)
+        messages.success(self.request, self.success_message)
+        return response
 
-    return render(
-        request,
-        "dashboard/education_form.html",
-        {
-            "profile": profile,
-            "form": form,
-            "mode": "add",
-        },
-    )
+    def form_invalid(self, form):
+        if self.invalid_message:
+            messages.error(self.request, self.invalid_message)
+        return super().form_invalid(form)
 
 
-@login_required
-def dashboard_education_edit_view(request, pk: int):
-    """
-    Dashboard: Edit an existing Education entry.
-    """
-    profile = Profile.objects.first()
-    education = get_object_or_404(Education, pk=pk)
+class ProjectCreateView(DashboardCRUDMixin, CreateView):
+    form_class = ProjectForm
+    template_name = "dashboard/project_form.html"
+    success_message = "Project added successfully."
+    mode = "add"
 
-    if request.method == "POST":
-        form = EducationForm(request.POST, instance=education)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Education updated successfully.")
-            return redirect("main:dashboard")
-        messages.error(request, "Please correct the errors below.")
-    else:
-        form = EducationForm(instance=education)
 
-    return render(
-        request,
-        "dashboard/education_form.html",
-        {
-            "profile": profile,
-            "form": form,
-            "mode": "edit",
-            "education": education,
-        },
-    )
+class ProjectUpdateView(DashboardCRUDMixin, UpdateView):
+    model = Project
+    form_class = ProjectForm
+    template_name = "dashboard/project_form.html"
+    success_message = "Project updated successfully."
+    mode = "edit"
 
 
-@login_required
-def dashboard_education_delete_view(request, pk: int):
-    """
-    Dashboard: Confirm + delete an Education entry.
-    """
-    profile = Profile.objects.first()
-    education = get_object_or_404(Education, pk=pk)
+class ProjectDeleteView(DashboardCRUDMixin, DeleteView):
+    queryset = Project.objects.only("title")  # confirm page shows just these
+    template_name = "dashboard/project_delete.html"
+    success_message = "Project deleted successfully."
 
-    if request.method == "POST":
-        education.delete()
-        messages.success(request, "Education deleted successfully.")
-        return redirect("main:dashboard")
 
-    return render(
-        request,
-        "dashboard/education_delete.html",
-        {
-            "profile": profile,
-            "education": education,
-        },
-    )
+class EducationCreateView(DashboardCRUDMixin, CreateView):
+    form_class = EducationForm
+    template_name = "dashboard/education_form.html"
+    success_message = "Education added successfully."
+    invalid_message = "Please correct the errors below."
+    mode = "add"
 
 
-@login_required
-def dashboard_experience_add_view(request):
-    """
-    Dashboard: Add a new Experience entry.
-    """
-    profile = Profile.objects.first()
+class EducationUpdateView(DashboardCRUDMixin, UpdateView):
+    model = Education
+    form_class = EducationForm
+    template_name = "dashboard/education_form.html"
+    success_message = "Education updated successfully."
+    invalid_message = "Please correct the errors below."
+    mode = "edit"
 
-    if request.method == "POST":
-        form = ExperienceForm(request.POST)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Experience added successfully.")
-            return redirect("main:dashboard")
-        messages.error(request, "Please correct the errors below.")
-    else:
-        form = ExperienceForm()
 
-    return render(
-        request,
-        "dashboard/experience_form.html",
-        {"profile": profile, "form": form, "mode": "add"},
-    )
+class EducationDeleteView(DashboardCRUDMixin, DeleteView):
+    queryset = Education.objects.only("degree", "institution")
+    template_name = "dashboard/education_delete.html"
+    success_message = "Education deleted successfully."
 
 
-@login_required
-def dashboard_experience_edit_view(request, pk: int):
-    """
-    Dashboard: Edit an existing Experience entry.
-    """
-    profile = Profile.objects.first()
-    experience = get_object_or_404(Experience, pk=pk)
+class ExperienceCreateView(DashboardCRUDMixin, CreateView):
+    form_class = ExperienceForm
+    template_name = "dashboard/experience_form.html"
+    success_message = "Experience added successfully."
+    invalid_message = "Please correct the errors below."
+    mode = "add"
 
-    if request.method == "POST":
-        form = ExperienceForm(request.POST, instance=experience)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Experience updated successfully.")
-            return redirect("main:dashboard")
-        messages.error(request, "Please correct the errors below.")
-    else:
-        form = ExperienceForm(instance=experience)
 
-    return render(
-        request,
-        "dashboard/experience_form.html",
-        {"profile": profile, "form": form, "mode": "edit", "experience": experience},
-    )
+class ExperienceUpdateView(DashboardCRUDMixin, UpdateView):
+    model = Experience
+    form_class = ExperienceForm
+    template_name = "dashboard/experience_form.html"
+    success_message = "Experience updated successfully."
+    invalid_message = "Please correct the errors below."
+    mode = "edit"
 
 
-@login_required
-def dashboard_experience_delete_view(request, pk: int):
-    """
-    Dashboard: Confirm + delete an Experience entry.
-    """
-    profile = Profile.objects.first()
-    experience = get_object_or_404(Experience, pk=pk)
+class ExperienceDeleteView(DashboardCRUDMixin, DeleteView):
+    queryset = Experience.objects.only("role", "organization")
+    template_name = "dashboard/experience_delete.html"
+    success_message = "Experience deleted successfully."
 
-    if request.method == "POST":
-        experience.delete()
-        messages.success(request, "Experience deleted successfully.")
-        return redirect("main:dashboard")
 
-    return render(
-        request,
-        "dashboard/experience_delete.html",
-        {"profile": profile, "experience": experience},
-    )
+# Names the URLconf imports.
+dashboard_project_add_view = ProjectCreateView.as_view()
+dashboard_project_edit_view = ProjectUpdateView.as_view()
+dashboard_project_delete_view = ProjectDeleteView.as_view()
+dashboard_education_add_view = EducationCreateView.as_view()
+dashboard_education_edit_view = EducationUpdateView.as_view()
+dashboard_education_delete_view = EducationDeleteView.as_view()
+dashboard_experience_add_view = ExperienceCreateView.as_view()
+dashboard_experience_edit_view = ExperienceUpdateView.as_view()
+dashboard_experience_delete_view = ExperienceDeleteView.as_view()
 
 
 @login_required
+@require_http_methods(["GET", "POST"])
 def dashboard_site_settings_edit_view(request):
     """
     Edit Site Settings from frontend.
@@ -400,27 +323,6 @@ def dashboard_site_settings_edit_view(request):
     if not site_settings:
         site_settings = SiteSettings.objects.create()
 
-    # Ensure defaults are set if fields are empty
-    if not site_settings.site_title:
-        site_settings.site_title = SiteSettings._meta.get_field('site_title').default
-    if not site_settings.primary_color:
-        site_settings.primary_color = SiteSettings._meta.get_field('primary_color').default
-    if not site_settings.secondary_color:
-        site_settings.secondary_color = SiteSettings._meta.get_field('secondary_color').default
-    if not site_settings.accent_color:
-        site_settings.accent_color = SiteSettings._meta.get_field('accent_color').default
-    if not site_settings.about_page_title:
-        site_settings.about_page_title = SiteSettings._meta.get_field('about_page_title').default
-    if not site_settings.about_page_subtitle:
-        site_settings.about_page_subtitle = SiteSettings._meta.get_field('about_page_subtitle').default
-    if not site_settings.experience_page_title:
-        site_settings.experience_page_title = SiteSettings._meta.get_field('experience_page_title').default
-    if not site_settings.projects_page_title:
-        site_settings.projects_page_title = SiteSettings._meta.get_field('projects_page_title').default
-    if not site_settings.contact_page_title:
-        site_settings.contact_page_title = SiteSettings._meta.get_field('contact_page_title').default
-    site_settings.save()
-
     if request.method == "POST":
         form = SiteSettingsForm(request.POST, instance=site_settings)
         if form.is_valid():
@@ -4,153 +4,257 @@ Test script for theme system functionality
 """
 import os
 import sys
-import django
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
+
+# Palette checks only need this plain-data module; Django is set up lazily
+# for the sections that touch models, the DB or templates
+from main.themes import DEFAULT_THEME, THEME_CHOICES, THEMES, theme_colors
 
-# Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Dark_Red_Portfolio.settings')
-django.setup()
 
-from main.models import SiteSettings
+EXPECTED_KEYS = frozenset(('primary', 'secondary', 'accent', 'bg0', 'bg1', 'card', 'text', 'muted', 'border'))
+COLOR_PREFIXES = ('#', 'rgba(', 'linear-gradient(')
+THEME_NAMES = list(map(itemgetter(0), THEME_CHOICES))
+
+@lru_cache(maxsize=None)
+def setup_django():
+    """Set up Django once, on first use"""
+    import django
+    django.setup()
+
+@lru_cache(maxsize=None)
+def theme_template():
+    """Parsed once; the integration test only renders it"""
+    setup_django()
+    from django.template import Template
+    return Template("""
+        {% load static %}
+        {% with colors=site_settings.get_theme_colors %}
+        <style>
+            :root{
+                --bg0: {{ colors.bg0 }};
+                --primary: {{ colors.primary }};
+            }
+        </style>
+        {% endwith %}
+        """)
+
+def write_report(lines):
+    """Write a test's buffered report in one call instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def is_valid_color(value):
+    """Hex codes, rgba() and linear-gradient() values (blank strings match no prefix)"""
+    return isinstance(value, str) and value.startswith(COLOR_PREFIXES)
+
+def validate_theme_colors(colors):
+    """
+    Return (missing_keys, invalid_colors) for a palette mapping.
+    Valid colors are non-empty strings that are hex codes, rgba() or linear-gradient().
+    """
+    # Subset test first; the difference is only built for the report when keys are missing
+    missing = () if EXPECTED_KEYS <= colors.keys() else tuple(sorted(EXPECTED_KEYS - colors.keys()))
+    # One short-circuiting pass on the common all-valid path; the detailed
+    # list is only built when something fails
+    if all(is_valid_color(value) for value in colors.values()):
+        return missing, ()
+    invalid = tuple(sorted(
+        f"{key}: {value}" for key, value in colors.items() if not is_valid_color(value)
+    ))
+    return missing, invalid
+
+def check_theme(theme):
+    """Check one theme's palette; returns (passed, report_lines)"""
+    lines = []
+    log = lines.append
+    passed = True
+
+    log(f"🎨 Testing theme: {theme}")
 
-def test_theme_colors():
+    # Get theme colors
+    colors = theme_colors(theme)
+
+    missing_keys, invalid_colors = validate_theme_colors(colors)
+
+    # Check if all expected keys are present
+    if missing_keys:
+        log(f"  ❌ Missing keys: {list(missing_keys)}")
+        passed = False
+    else:
+        log("  ✅ All required color keys present")
+
+    # Check if colors are valid CSS color values (basic validation)
+    if invalid_colors:
+        log(f"  ❌ Invalid color formats: {list(invalid_colors)}")
+        passed = False
+    else:
+        log("  ✅ All colors are valid CSS color values")
+
+    # Show sample colors
+    log(f"  🎨 Primary: {colors['primary']}, Secondary: {colors['secondary']}, BG: {colors['bg0']}")
+    log("")
+    return passed, lines
+
+def run_theme_checks():
     """Test that all themes return valid color schemes"""
-    print("🧪 Testing Theme System Implementation")
-    print("=" * 50)
+    # Report lines are buffered and written once at the end
+    lines = []
+    log = lines.append
+
+    log("🧪 Testing Theme System Implementation")
+    log("=" * 50)
 
     # Test all theme choices
-    themes = [choice[0] for choice in SiteSettings.THEME_CHOICES]
-    expected_keys = ['primary', 'secondary', 'accent', 'bg0', 'bg1', 'card', 'text', 'muted', 'border']
+    themes = THEME_NAMES
 
-    print(f"📋 Testing {len(themes)} themes: {', '.join(themes)}")
-    print()
+    log(f"📋 Testing {len(themes)} themes: {', '.join(themes)}")
+    log("")
 
     all_passed = True
 
-    for theme in themes:
-        print(f"🎨 Testing theme: {theme}")
+    # Each theme is checked independently; reports are kept in theme order
+    for passed, theme_lines in map(check_theme, themes):
+        lines.extend(theme_lines)
+        all_passed = all_passed and passed
 
-        # Create a SiteSettings instance with this theme
-        settings = SiteSettings(theme=theme)
+    # Test default theme fallback
+    log("🔄 Testing default theme fallback")
+    colors = theme_colors('nonexistent_theme')
+    # theme_colors() hands back the shared frozen palette, so identity is enough
+    if colors is THEMES[DEFAULT_THEME]:
+        log("  ✅ Default theme fallback works correctly")
+    else:
+        log("  ❌ Default theme fallback failed")
+        all_passed = False
+    log("")
 
-        # Get theme colors
-        colors = settings.get_theme_colors()
+    # Test that the model method hands out the same palettes. It only reads
+    # self.theme, so a plain namespace stands in for a SiteSettings instance
+    log("🔗 Testing SiteSettings.get_theme_colors")
+    try:
+        setup_django()
+        from main.models import SiteSettings
 
-        # Check if all expected keys are present
-        missing_keys = [key for key in expected_keys if key not in colors]
-        if missing_keys:
-            print(f"  ❌ Missing keys: {missing_keys}")
-            all_passed = False
-        else:
-            print("  ✅ All required color keys present")
-
-        # Check if colors are valid CSS color values (basic validation)
-        invalid_colors = []
-        for key, value in colors.items():
-            if not isinstance(value, str) or not value.strip():
-                invalid_colors.append(f"{key}: {value}")
-            # Allow hex codes, rgba(), and linear-gradient() values
-            elif not (value.startswith('#') or value.startswith('rgba(') or value.startswith('linear-gradient(')):
-                invalid_colors.append(f"{key}: {value}")
-
-        if invalid_colors:
-            print(f"  ❌ Invalid color formats: {invalid_colors}")
+        probe = SimpleNamespace(theme=None)
+        mismatched = []
+        for theme in [*THEME_NAMES, 'nonexistent_theme']:
+            probe.theme = theme
+            if SiteSettings.get_theme_colors(probe) is not theme_colors(theme):
+                mismatched.append(theme)
+
+        if mismatched:
+            log(f"  ❌ Palettes differ for: {mismatched}")
             all_passed = False
         else:
-            print("  ✅ All colors are valid CSS color values")
-
-        # Show sample colors
-        print(f"  🎨 Primary: {colors['primary']}, Secondary: {colors['secondary']}, BG: {colors['bg0']}")
-        print()
-
-    # Test default theme fallback
-    print("🔄 Testing default theme fallback")
-    settings = SiteSettings(theme='nonexistent_theme')
-    colors = settings.get_theme_colors()
-    if colors == settings.get_theme_colors.__defaults__[0]['dark_red']:
-        print("  ✅ Default theme fallback works correctly")
-    else:
-        print("  ❌ Default theme fallback failed")
+            log("  ✅ Model returns the shared palettes")
+    except Exception as e:
+        log(f"  ❌ Model palette lookup failed: {e}")
         all_passed = False
-    print()
+    log("")
 
     # Test database operations
-    print("💾 Testing database operations")
+    log("💾 Testing database operations")
     try:
-        # Create or get existing settings
-        settings, created = SiteSettings.objects.get_or_create(
-            defaults={'site_title': 'Test Site'}
-        )
-
-        # Test theme saving and retrieval
-        original_theme = settings.theme
-        settings.theme = 'dark_blue'
-        settings.save()
-
-        # Refresh from database
-        settings.refresh_from_db()
-        if settings.theme == 'dark_blue':
-            print("  ✅ Theme persistence works correctly")
-        else:
-            print("  ❌ Theme persistence failed")
-            all_passed = False
+        setup_django()
+        from django.db import connection, transaction
+        from main.models import SiteSettings
+
+        # Open the connection up front; the statements below reuse it
+        connection.ensure_connection()
+
+        # The whole probe is rolled back afterwards, so the live table is never
+        # touched (including the row get_or_create may insert)
+        with transaction.atomic():
+            # Create or get the singleton settings row (primary-key lookup)
+            settings, created = SiteSettings.objects.get_or_create(
+                pk=1, defaults={'site_title': 'Test Site'}
+            )
+
+            # Test theme saving and retrieval (theme column only)
+            SiteSettings.objects.filter(pk=settings.pk).update(theme='dark_blue')
+
+            # Refresh from database
+            settings.refresh_from_db(fields=['theme'])
+            if settings.theme == 'dark_blue':
+                log("  ✅ Theme persistence works correctly")
+            else:
+                log("  ❌ Theme persistence failed")
+                all_passed = False
 
-        # Restore original theme
-        settings.theme = original_theme
-        settings.save()
+            transaction.set_rollback(True)
 
     except Exception as e:
-        print(f"  ❌ Database operation failed: {e}")
+        log(f"  ❌ Database operation failed: {e}")
         all_passed = False
 
-    print()
-    print("=" * 50)
+    log("")
+    log("=" * 50)
     if all_passed:
-        print("🎉 ALL TESTS PASSED! Theme system is working correctly.")
+        log("🎉 ALL TESTS PASSED! Theme system is working correctly.")
     else:
-        print("❌ SOME TESTS FAILED! Please review the implementation.")
+        log("❌ SOME TESTS FAILED! Please review the implementation.")
 
+    write_report(lines)
     return all_passed
 
-def test_template_integration():
+def run_template_integration():
     """Test that templates can access theme colors"""
-    print("\n🔧 Testing Template Integration")
-    print("=" * 30)
+    lines = []
+    log = lines.append
 
-    try:
-        from django.template import Template, Context
+    log("\n🔧 Testing Template Integration")
+    log("=" * 30)
 
-        # Test template rendering with theme colors
-        template_content = """
-        {% load static %}
-        <style>
-            :root{
-                --bg0: {{ site_settings.get_theme_colors.bg0 }};
-                --primary: {{ site_settings.get_theme_colors.primary }};
-            }
-        </style>
-        """
+    try:
+        template = theme_template()
+        from django.template import Context
+        from main.models import SiteSettings
 
-        template = Template(template_content)
+        # Test template rendering with theme colors (via SiteSettings.get_theme_colors)
         settings = SiteSettings(theme='cyberpunk')
         context = Context({'site_settings': settings})
         rendered = template.render(context)
 
         # Check if theme colors are rendered
         if '--bg0: #0a0a0a' in rendered and '--primary: #00ff88' in rendered:
-            print("✅ Template integration works correctly")
+            log("✅ Template integration works correctly")
             return True
         else:
-            print("❌ Template integration failed")
-            print("Rendered output:", rendered)
+            log("❌ Template integration failed")
+            log(f"Rendered output: {rendered}")
             return False
 
     except Exception as e:
-        print(f"❌ Template integration test failed: {e}")
+        log(f"❌ Template integration test failed: {e}")
         return False
 
+    finally:
+        write_report(lines)
+
+# pytest entry points: one test node per theme, so a failure names its palette
+# and -n auto / --lf work per theme. Running this file directly doesn't need pytest.
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+if pytest is not None:
+    @pytest.mark.parametrize('theme', THEME_NAMES)
+    def test_theme_colors(theme):
+        passed, lines = check_theme(theme)
+        assert passed, "\n".join(lines)
+
+    def test_theme_fallback():
+        assert theme_colors('nonexistent_theme') is THEMES[DEFAULT_THEME]
+
+    def test_template_integration():
+        assert run_template_integration()
+
 if __name__ == '__main__':
-    success1 = test_theme_colors()
-    success2 = test_template_integration()
+    success1 = run_theme_checks()
+    success2 = run_template_integration()
 
     if success1 and success2:
         print("\n🎯 Theme system implementation is COMPLETE and WORKING!")